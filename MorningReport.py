@@ -8,28 +8,142 @@ Author: Your Name
 Created: 2025
 """
 
+import io
 import os
+import codecs
 import re
+import time
+import shelve
+import asyncio
 import smtplib
+from functools import lru_cache
+from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
-import requests
+import httpx
 import markdown
-from bs4 import BeautifulSoup
+import pandas as pd
+import lxml.etree
+import lxml.html
 from google import genai
 
 
+# HTTP settings shared by every listing and article fetch
+_REQUEST_TIMEOUT = 10.0
+_RETRY_STATUSES = (502, 503, 504)
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+# Upper bound on concurrent article fetches; HTTP/2 multiplexes them over the pool
+_MAX_WORKERS = 64
+_MAX_CONNECTIONS = 32
+# Cache entries not refreshed for this long are pruned when the cache is opened
+_CACHE_MAX_AGE = 7 * 24 * 3600
+_MAX_AGE_RE = re.compile(r'max-age\s*=\s*"?(\d+)', re.IGNORECASE)
+
+# Moneycontrol timestamp patterns, compiled once for the per-article parse
+_IST_RE = re.compile(r"/\s*\d{2}:\d{2}\s*IST")
+_TS_RE = re.compile(r'([A-Za-z]+\s+\d{1,2},\s+\d{4})/?\s*(\d{2}:\d{2})?')
+_LIST_TS_RE = re.compile(r'([A-Za-z]+\s+\d{1,2},\s+\d{4})\s+(\d{1,2}:\d{2}\s*[AP]M)', re.IGNORECASE)
+
+# Divider written after every article in the report input
+_SEP = "-" * 80
+
+_GEMINI_MODEL = "gemini-2.5-flash"
+# Rough per-prompt budget for article text, estimated at ~4 characters per token
+_MAX_PROMPT_TOKENS = 50_000
+
+# Static prompt text, built once; only the article input is substituted per call
+_PROMPT_TEMPLATE = """
+You are a financial analyst generating a comprehensive Premarket Report for equity traders in India.
+
+Based on the following raw market news and updates, write a concise, actionable, and well-structured report suitable to be read by traders before the Indian stock market opens.
+
+The report should include:
+- 🔔 A crisp summary of global cues (GIFT Nifty, US markets, crude, gold, dollar index, bond yields, Asian markets)
+- 📊 Domestic market setup: Nifty/Sensex close, support/resistance levels, VIX, FII/DII flows, PCR
+- 🔍 Stocks in Focus with reason (news impact, earnings, regulatory update, deals, etc.)
+- 💹 Top Trading Ideas (stock, CMP, buy/sell, target, SL)
+- 📢 Corporate actions or events (dividends, bonus, board meetings, SME listings)
+- 🧾 Bulk/Block deals or fund flow highlights
+- ⚠️ Risks to watch (macro, geopolitical, etc.)
+- ✅ A strategy summary to guide the trading day
+
+Remove any fluff before the first emoji section like 🔔 or 📊.
+Format the output using emojis and headers to make it engaging and scannable. Keep the tone clear, professional, and trader-friendly.
+
+Here is the raw input: {input} """
+
+_SUMMARY_PROMPT_TEMPLATE = """
+You are a financial analyst preparing notes for a Premarket Report for equity traders in India.
+
+Condense the following raw market news into concise bullet points. Keep every index level, price, target, stop loss, fund flow figure, stock name, and date; drop anything that is not market-relevant.
+
+Here is the raw input: {input} """
+
+
+# Keyed by normalised codec name, so the cache stays small whatever servers send
+@lru_cache(maxsize=16)
+def _html_parser(encoding: str) -> lxml.html.HTMLParser:
+	"""
+	Return a shared HTML parser that decodes documents as `encoding`.
+	"""
+	return lxml.html.HTMLParser(encoding=encoding)
+
+
+def _has_class(name: str) -> str:
+	"""
+	Build an XPath predicate matching elements whose class list contains `name`.
+	"""
+	return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Article page fields, compiled once and evaluated against the lxml tree
+_XP_TITLE = lxml.etree.XPath(f'string(//*[{_has_class("article_title")}])')
+_XP_SUMMARY = lxml.etree.XPath(f'string(//*[{_has_class("article_desc")}])')
+_XP_TIMESTAMP = lxml.etree.XPath(f'(//*[{_has_class("article_schedule")}])[1]//text()')
+_XP_AUTHOR = lxml.etree.XPath(f'string((//*[{_has_class("content_block")}]//span)[1])')
+_XP_IMG_URL = lxml.etree.XPath(f'(//*[{_has_class("article_image")}]//img/@data-src)[1]')
+_XP_CONTENT = lxml.etree.XPath(f'//*[{_has_class("content_wrapper")}]/p')
+_XP_TAGS = lxml.etree.XPath(f'//*[{_has_class("tags_first_line")}]/a')
+
+# Listing page containers, plus the timestamp and links inside each container
+_XP_LIST_CONTAINERS = lxml.etree.XPath(f'//*[{_has_class("clearfix")}]')
+_XP_LIST_TIME = lxml.etree.XPath('string(./span[1])')
+_XP_LIST_HREFS = lxml.etree.XPath('.//a/@href')
+
+
+def _stripped_text(element) -> str:
+	"""
+	Join the stripped text nodes of an element, like BeautifulSoup's get_text(strip=True).
+	"""
+	return "".join(text.strip() for text in element.itertext())
+
+
+@dataclass(slots=True)
+class Article:
+	"""
+	A scraped Moneycontrol article.
+	"""
+	title: Optional[str]
+	summary: Optional[str]
+	timestamp: Optional[str]
+	author: Optional[str]
+	img_url: Optional[str]
+	content: str
+	tags: List[str]
+
+
 class PremarketReportGenerator:
 	"""
 	A class to scrape financial news, generate premarket reports, and send them via email.
 	"""
 	
-	def __init__(self, gemini_api_key: str, email_config: Optional[Dict[str, str]] = None):
+	def __init__(self, gemini_api_key: str, email_config: Optional[Dict[str, str]] = None,
+				 cache_path: Optional[str] = None):
 		"""
 		Initialize the report generator.
 		
@@ -39,137 +153,465 @@ class PremarketReportGenerator:
 				- from_email: Sender email address
 				- app_password: Gmail app password
 				- to_email: Recipient email address
+			cache_path (str, optional): Path of an on-disk article cache; disabled by default
 		"""
-		self.gemini_client = genai.Client(api_key=gemini_api_key)
 		self.email_config = email_config or {}
-		self.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-	
-	def get_article(self, article_url: str) -> Dict[str, Optional[str]]:
+		self.headers = {
+			'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+			# Ask for compressed pages; httpx inflates them (brotli via the Brotli package)
+			'Accept-Encoding': 'gzip, deflate, br',
+		}
+
+		# Private event loop so the pooled httpx client survives across sync calls
+		self._loop = asyncio.new_event_loop()
+		self._client: Optional[httpx.AsyncClient] = None
+
+		# One Gemini client per instance: its async half is bound to this instance's loop
+		self.gemini_client = genai.Client(api_key=gemini_api_key)
+		self._smtp: Optional[smtplib.SMTP_SSL] = None
+
+		# Parsed articles plus their ETag/Last-Modified validators, keyed by URL
+		self._cache = shelve.open(cache_path) if cache_path else None
+		self._prune_cache()
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, exc_type, exc_value, traceback):
+		self.close()
+
+	def close(self) -> None:
+		"""
+		Close the underlying HTTP client, SMTP connection and article cache. Safe to call twice.
+		"""
+		if self._loop.is_closed():
+			return
+		self.close_smtp()
+		if self._cache is not None:
+			self._cache.close()
+			self._cache = None
+		if self._client is not None and not self._client.is_closed:
+			self._loop.run_until_complete(self._client.aclose())
+		# Close the async Gemini client on the loop its connections belong to
+		self._loop.run_until_complete(self.gemini_client.aio.aclose())
+		self.gemini_client.close()
+		self._loop.close()
+
+	def _prune_cache(self) -> None:
+		"""
+		Drop cache entries that have not been refreshed within `_CACHE_MAX_AGE`.
+		"""
+		if self._cache is None:
+			return
+		oldest = time.time() - _CACHE_MAX_AGE
+		for url in list(self._cache.keys()):
+			entry = self._read_cache(url)
+			if entry is not None and entry["fetched_at"] < oldest:
+				del self._cache[url]
+
+	def _read_cache(self, url: str) -> Optional[Dict]:
+		"""
+		Load a cache entry, rebuilding its Article.
+
+		Entries that cannot be read or do not have the expected shape (e.g. written by an
+		older version of this module) are treated as a miss and deleted, so the URL is
+		fetched fresh instead of failing.
+
+		Args:
+			url (str): Article URL the entry is keyed by
+
+		Returns:
+			dict | None: The cache entry, or None on a miss
+		"""
+		if self._cache is None:
+			return None
+		try:
+			entry = self._cache.get(url)
+			if entry is None:
+				return None
+
+			# Check the layout written by `get_article`; anything else is a miss
+			if not isinstance(entry, dict):
+				raise ValueError("cache entry is not a dict")
+			for key in ("fetched_at", "fresh_until"):
+				if not isinstance(entry.get(key), (int, float)):
+					raise ValueError(f"cache entry has no numeric {key!r}")
+			article = entry.get("article", ...)
+			if article is ...:
+				raise ValueError("cache entry has no article")
+			if article is not None:
+				# Articles without content are never cached as Articles (see `_parse_article`)
+				if not isinstance(article, dict) or not isinstance(article.get("content"), str) or not article["content"]:
+					raise ValueError("cached article has no content")
+				entry["article"] = Article(**article)
+			return entry
+		except Exception:
+			try:
+				del self._cache[url]
+			except KeyError:
+				pass
+			return None
+
+	def _cache_lifetime(self, response: httpx.Response) -> Optional[int]:
+		"""
+		Work out how long a response may be served from the cache without revalidation.
+
+		Args:
+			response (httpx.Response): Response to inspect
+
+		Returns:
+			int | None: Fresh lifetime in seconds (0 means revalidate on every use), or None
+				if the response must not be stored
+		"""
+		cache_control = response.headers.get("Cache-Control", "").lower()
+		if "no-store" in cache_control:
+			return None
+		if "no-cache" in cache_control:
+			return 0
+		match = _MAX_AGE_RE.search(cache_control)
+		return int(match.group(1)) if match else 0
+
+	def _get_client(self) -> httpx.AsyncClient:
+		"""
+		Return the shared httpx client, creating it on first use.
+
+		Returns:
+			httpx.AsyncClient: HTTP/2 client with pooled keep-alive connections
+		"""
+		if self._client is None or self._client.is_closed:
+			self._client = httpx.AsyncClient(
+				http2=True,
+				headers=self.headers,
+				limits=httpx.Limits(max_connections=_MAX_CONNECTIONS, max_keepalive_connections=_MAX_CONNECTIONS),
+				timeout=_REQUEST_TIMEOUT,
+				follow_redirects=True,
+			)
+		return self._client
+
+	async def _request(self, client: httpx.AsyncClient, url: str,
+					   headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+		"""
+		Issue a GET request, retrying transient gateway errors with exponential backoff.
+
+		Args:
+			client (httpx.AsyncClient): Client to issue the request on
+			url (str): URL to fetch
+			headers (dict, optional): Extra request headers
+
+		Returns:
+			httpx.Response: The final response, with its body already read
+
+		Raises:
+			httpx.HTTPError: If the request ultimately fails or times out
+		"""
+		for attempt in range(_MAX_RETRIES + 1):
+			try:
+				response = await client.get(url, headers=headers)
+				if response.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+					# httpx treats 304 as an error, but it is a valid answer to a conditional GET
+					if response.status_code != 304:
+						response.raise_for_status()
+					return response
+			except httpx.TransportError:
+				if attempt == _MAX_RETRIES:
+					raise
+			await asyncio.sleep(_BACKOFF_FACTOR * (2 ** attempt))
+
+	def _response_encoding(self, response: httpx.Response) -> str:
+		"""
+		Return the charset declared in the response's Content-Type, falling back to UTF-8.
+
+		Args:
+			response (httpx.Response): Response to inspect
+
+		Returns:
+			str: Encoding to decode the body with
+		"""
+		charset = response.charset_encoding
+		if charset:
+			try:
+				encoding = codecs.lookup(charset).name
+				# Python and libxml2 know different codecs; make sure the parser accepts it too
+				_html_parser(encoding)
+				return encoding
+			except LookupError:
+				print(f"⚠️ Unknown charset {charset!r}, decoding as UTF-8")
+		return "utf-8"
+
+	async def get_article(self, client: httpx.AsyncClient, article_url: str) -> Optional[Article]:
 		"""
 		Scrape detailed information from a Moneycontrol article page.
 
 		Args:
+			client (httpx.AsyncClient): Client to fetch the article with
 			article_url (str): URL of the article
 
 		Returns:
-			dict: Dictionary containing article metadata and content
+			Article | None: Article metadata and content, or None if the page has no article body
 
 		Raises:
 			RuntimeError: If article cannot be fetched or parsed
 		"""
+		entry = self._read_cache(article_url)
+		if entry is not None and time.time() < entry.get("fresh_until", 0):
+			return entry["article"]
+
+		# Revalidate a stale cache entry instead of downloading it again
+		headers = {}
+		if entry is not None:
+			if entry.get("etag"):
+				headers["If-None-Match"] = entry["etag"]
+			if entry.get("last_modified"):
+				headers["If-Modified-Since"] = entry["last_modified"]
+
 		try:
-			response = requests.get(article_url, headers=self.headers, timeout=10)
-			response.raise_for_status()
-			soup = BeautifulSoup(response.content.decode("utf-8", "ignore"), "html.parser")
+			response = await self._request(client, article_url, headers)
+			not_modified = response.status_code == 304 and entry is not None
+			if not_modified:
+				article = entry["article"]
+			else:
+				article = self._parse_article(response.content, self._response_encoding(response))
 		except Exception as e:
 			raise RuntimeError(f"Failed to fetch or parse article: {e}")
 
-		article = {}
+		if self._cache is not None:
+			lifetime = self._cache_lifetime(response)
+			if lifetime is None:
+				self._cache.pop(article_url, None)
+			else:
+				# A 304 may omit the validators, in which case the cached ones still apply
+				fallback = entry if not_modified else {}
+				now = time.time()
+				self._cache[article_url] = {
+					"etag": response.headers.get("ETag") or fallback.get("etag"),
+					"last_modified": response.headers.get("Last-Modified") or fallback.get("last_modified"),
+					"fetched_at": now,
+					"fresh_until": now + lifetime,
+					# Plain data, so the cache does not depend on where Article was imported from
+					"article": asdict(article) if article is not None else None,
+				}
+
+		return article
 
-		# Extract title
-		title_tag = soup.find(attrs={"class": "article_title"})
-		article["title"] = title_tag.string.strip() if title_tag and title_tag.string else None
+	def _parse_article(self, content: bytes, encoding: str = "utf-8") -> Optional[Article]:
+		"""
+		Extract article metadata and content from the HTML of an article page.
 
-		# Extract summary
-		summary_tag = soup.find(attrs={"class": "article_desc"})
-		article["summary"] = summary_tag.string.strip() if summary_tag and summary_tag.string else None
+		Args:
+			content (bytes): Raw article HTML
+			encoding (str): Charset to decode the HTML with
 
-		# Extract timestamp
-		time_tag = soup.find(attrs={"class": "article_schedule"})
-		time_date_string = ""
-		if time_tag:
-			for element in time_tag.contents:
-				if hasattr(element, 'string') and element.string and element.string.strip():
-					time_date_string += element.string.strip()
-		article["timestamp"] = time_date_string or None
+		Returns:
+			Article | None: Article metadata and content, or None if the page has no article body
+		"""
+		tree = lxml.html.fromstring(content, parser=_html_parser(encoding))
 
-		# Extract author
-		author_tag = soup.select_one(".content_block span")
-		article["author"] = author_tag.string.strip() if author_tag and author_tag.string else None
+		# Extract article content; pages without a body are useless downstream
+		paragraphs = [_stripped_text(p) for p in _XP_CONTENT(tree)]
+		paragraphs = [p for p in paragraphs if p]
+		if not paragraphs:
+			return None
 
 		# Extract image URL
-		img_tag = soup.select_one(".article_image img")
-		article["img_url"] = img_tag["data-src"] if img_tag and img_tag.has_attr("data-src") else None
-
-		# Extract article content
-		content_tags = soup.select(".content_wrapper > p")
-		content = [c.get_text(strip=True) for c in content_tags if c.get_text(strip=True)]
-		article["content"] = " ".join(content) if content else None
+		img_urls = _XP_IMG_URL(tree)
 
 		# Extract tags
-		tag_links = soup.select(".tags_first_line > a")
-		article["tags"] = [tag.get_text(strip=True).lstrip("#") for tag in tag_links if tag.get_text(strip=True)]
+		tags = [_stripped_text(a) for a in _XP_TAGS(tree)]
+
+		return Article(
+			title=_XP_TITLE(tree).strip() or None,
+			summary=_XP_SUMMARY(tree).strip() or None,
+			timestamp="".join(text.strip() for text in _XP_TIMESTAMP(tree)) or None,
+			author=_XP_AUTHOR(tree).strip() or None,
+			img_url=str(img_urls[0]) if img_urls else None,
+			content=" ".join(paragraphs),
+			tags=[tag.lstrip("#") for tag in tags if tag],
+		)
 
-		return article
+	async def _fetch_page(self, client: httpx.AsyncClient, url: str, page: int) -> Optional[httpx.Response]:
+		"""
+		Download a single listing page.
 
-	def get_news_links(self, pages: int = 10) -> List[str]:
+		Args:
+			client (httpx.AsyncClient): Client to fetch the page with
+			url (str): URL of the listing page
+			page (int): Page number, used for logging
+
+		Returns:
+			httpx.Response | None: The page response, or None if the fetch failed
 		"""
-		Scrape news article links from Moneycontrol's 'stocks' section.
+		try:
+			return await self._request(client, url)
+		except httpx.HTTPError as e:
+			print(f"❌ Failed to fetch page {page}: {e}")
+			return None
+
+	def _parse_page_links(self, url: str, content: bytes, links: Dict[str, Optional[datetime]],
+						  encoding: str = "utf-8") -> None:
+		"""
+		Extract news links and their listing timestamps from the HTML of a listing page.
 
 		Args:
+			url (str): URL of the listing page, used to resolve relative links
+			content (bytes): Raw page HTML
+			links (dict): Mapping of article URL to listing time, updated in place
+			encoding (str): Charset to decode the HTML with
+		"""
+		target_prefix = "https://www.moneycontrol.com/news/"
+
+		tree = lxml.html.fromstring(content, parser=_html_parser(encoding))
+
+		# The same article shows up in several containers, so key by URL and
+		# keep whichever occurrence carried a listing timestamp
+		for container in _XP_LIST_CONTAINERS(tree):
+			listed_at = self.parse_listing_timestamp(_XP_LIST_TIME(container))
+
+			for href in _XP_LIST_HREFS(container):
+				full_url = urljoin(url, href)
+				if not full_url.startswith(target_prefix):
+					continue
+				if listed_at is not None or full_url not in links:
+					links[full_url] = listed_at
+
+	def parse_listing_timestamp(self, timestamp: str) -> Optional[datetime]:
+		"""
+		Parse the timestamp shown next to an article on a listing page, e.g. "July 24, 2025 07:32 AM IST".
+
+		Args:
+			timestamp (str): The raw timestamp string from the listing
+
+		Returns:
+			datetime | None: A datetime object if parsing is successful, else None
+		"""
+		match = _LIST_TS_RE.search(timestamp)
+		if not match:
+			return None
+
+		try:
+			return datetime.strptime(f"{match.group(1)} {match.group(2).upper()}", "%B %d, %Y %I:%M %p")
+		except ValueError:
+			return None
+
+	async def collect_news_links(self, client: httpx.AsyncClient,
+								 pages: int = 10) -> List[Tuple[str, Optional[datetime]]]:
+		"""
+		Scrape news article links from Moneycontrol's 'stocks' section, fetching all pages concurrently.
+
+		Args:
+			client (httpx.AsyncClient): Client to fetch the listing pages with
 			pages (int): Number of paginated pages to scrape
 
 		Returns:
-			list: Filtered list of unique article URLs from the 'markets' subsection
+			list: Unique (url, listed_at) pairs from the 'markets' subsection; listed_at is
+				None when the listing showed no parseable timestamp
 		"""
 		base_url = "https://www.moneycontrol.com/news/business/stocks/page-{}/"
-		target_prefix = "https://www.moneycontrol.com/news/"
 		market_prefix = "https://www.moneycontrol.com/news/business/markets/"
 
-		links = []
+		urls = [base_url.format(i) for i in range(1, pages + 1)]
+		responses = await asyncio.gather(*[
+			self._fetch_page(client, url, i) for i, url in enumerate(urls, start=1)
+		])
 
-		for i in range(1, pages + 1):
-			url = base_url.format(i)
-			try:
-				response = requests.get(url, headers=self.headers, timeout=10)
-				response.raise_for_status()
-			except requests.RequestException as e:
-				print(f"❌ Failed to fetch page {i}: {e}")
+		# Parse only once every page has arrived, skipping the ones that failed
+		links = {}
+		for i, (url, response) in enumerate(zip(urls, responses), start=1):
+			if response is None:
 				continue
+			try:
+				self._parse_page_links(url, response.content, links, self._response_encoding(response))
+			except lxml.etree.ParserError as e:
+				# e.g. an empty or whitespace-only body: skip it like a failed fetch
+				print(f"❌ Failed to parse page {i}: {e}")
 
-			soup = BeautifulSoup(response.text, 'html.parser')
-			containers = soup.find_all(class_='clearfix')
-
-			for container in containers:
-				for a in container.find_all('a', href=True):
-					full_url = urljoin(url, a['href'])
-					if full_url.startswith(target_prefix):
-						links.append(full_url)
-
-		# Remove duplicates and filter only 'markets' section links
+		# Keep only 'markets' section links
 		filtered_links = [
-			link for link in set(links)
+			(link, listed_at) for link, listed_at in links.items()
 			if link.startswith(market_prefix) and link != market_prefix
 		]
 
 		return filtered_links
 
-	def scrape_articles_multithreaded(self, links: List[str], max_workers: int = 10) -> List[Dict]:
+	def get_news_listings(self, pages: int = 10) -> List[Tuple[str, Optional[datetime]]]:
 		"""
-		Fetch articles concurrently using multithreading.
+		Synchronous wrapper around `collect_news_links` using the shared client.
+
+		Args:
+			pages (int): Number of paginated pages to scrape
+
+		Returns:
+			list: Unique (url, listed_at) pairs from the 'markets' subsection
+		"""
+		return self._loop.run_until_complete(self.collect_news_links(self._get_client(), pages))
+
+	def get_news_links(self, pages: int = 10) -> List[str]:
+		"""
+		Scrape news article links from Moneycontrol's 'stocks' section.
+
+		Args:
+			pages (int): Number of paginated pages to scrape
+
+		Returns:
+			list: Filtered list of unique article URLs from the 'markets' subsection
+		"""
+		return [url for url, _ in self.get_news_listings(pages)]
+
+	async def _scrape_one(self, client: httpx.AsyncClient, link: str, semaphore: asyncio.Semaphore) -> Optional[Article]:
+		"""
+		Fetch a single article, logging the outcome instead of raising.
+
+		Args:
+			client (httpx.AsyncClient): Client to fetch the article with
+			link (str): URL of the article
+			semaphore (asyncio.Semaphore): Limits the number of in-flight requests
+
+		Returns:
+			Article | None: The article, or None if it could not be scraped or has no content
+		"""
+		async with semaphore:
+			try:
+				article = await self.get_article(client, link)
+				if article is None:
+					print(f"⏭️ Skipped (no content): {link}")
+				else:
+					print(f"✅ Completed: {link}")
+				return article
+			except Exception as e:
+				print(f"❌ Failed: {link} | Reason: {e}")
+				return None
+
+	async def scrape_all(self, links: List[str], max_workers: Optional[int] = None) -> List[Article]:
+		"""
+		Fetch articles concurrently on the shared httpx client.
 
 		Args:
 			links (list): List of URLs to scrape
-			max_workers (int): Number of threads to use
+			max_workers (int, optional): Maximum number of concurrent requests. The work is
+				I/O-bound, so this defaults to one per link up to 64; lower
+				it to be gentler on the server
 
 		Returns:
 			list: List of successfully fetched article results
 		"""
-		all_articles = []
+		if max_workers is None:
+			max_workers = min(_MAX_WORKERS, len(links))
+		client = self._get_client()
+		semaphore = asyncio.Semaphore(max(1, max_workers))
+		results = await asyncio.gather(*[self._scrape_one(client, link, semaphore) for link in links])
+		return [article for article in results if article is not None]
+
+	def scrape_articles_multithreaded(self, links: List[str], max_workers: Optional[int] = None) -> List[Article]:
+		"""
+		Fetch articles concurrently. Kept as a synchronous wrapper around `scrape_all`.
 
-		with ThreadPoolExecutor(max_workers=max_workers) as executor:
-			future_to_url = {executor.submit(self.get_article, link): link for link in links}
-			
-			for future in as_completed(future_to_url):
-				link = future_to_url[future]
-				try:
-					article = future.result()
-					all_articles.append(article)
-					print(f"✅ Completed: {link}")
-				except Exception as e:
-					print(f"❌ Failed: {link} | Reason: {e}")
-		
-		return all_articles
+		Args:
+			links (list): List of URLs to scrape
+			max_workers (int, optional): Maximum number of concurrent requests, see `scrape_all`
+
+		Returns:
+			list: List of successfully fetched article results
+		"""
+		return self._loop.run_until_complete(self.scrape_all(links, max_workers))
 
 	def parse_article_timestamp(self, timestamp: str) -> Optional[datetime]:
 		"""
@@ -188,10 +630,10 @@ class PremarketReportGenerator:
 			# Normalize string
 			timestamp = timestamp.strip()
 			# Remove trailing time zone and slashes, e.g., "/ 09:30 IST"
-			timestamp = re.sub(r"/\s*\d{2}:\d{2}\s*IST", "", timestamp)
+			timestamp = _IST_RE.sub("", timestamp)
 
 			# Extract date and (optional) time
-			match = re.search(r'([A-Za-z]+\s+\d{1,2},\s+\d{4})/?\s*(\d{2}:\d{2})?', timestamp)
+			match = _TS_RE.search(timestamp)
 			if not match:
 				return None
 
@@ -205,89 +647,139 @@ class PremarketReportGenerator:
 			print(f"❌ Error parsing timestamp: {timestamp} | {e}")
 			return None
 
-	def filter_recent_articles(self, articles: List[Dict], hours: int = 24) -> List[Dict]:
+	def filter_recent_articles(self, articles: List[Article], hours: int = 24) -> List[Article]:
 		"""
 		Filter articles published in the last `hours` hours.
 
 		Args:
-			articles (list): List of article dicts (each containing a 'timestamp' key)
+			articles (list): List of articles
 			hours (int): Time range to filter in hours (default 24)
 
 		Returns:
 			list: Articles published within the given time window
 		"""
+		if not articles:
+			return []
+
 		cutoff = datetime.now() - timedelta(hours=hours)
-		recent = []
 
-		for article in articles:
-			dt = self.parse_article_timestamp(article.get("timestamp", ""))
-			if dt and dt >= cutoff:
-				recent.append(article)
+		# Same normalisation as `parse_article_timestamp`, applied to all timestamps at once;
+		# missing or unparseable timestamps become NaT and never pass the cutoff
+		raw = pd.Series([article.timestamp for article in articles], dtype="string")
+		parts = raw.str.strip().str.replace(_IST_RE, "", regex=True).str.extract(_TS_RE)
+		stamps = parts[0] + " " + parts[1].fillna("00:00")
+		parsed = pd.to_datetime(stamps, format="%B %d, %Y %H:%M", errors="coerce")
+		mask = (parsed >= cutoff).to_numpy()
 
-		return recent
+		return [article for article, keep in zip(articles, mask) if keep]
 
-	def format_articles_to_string(self, articles: List[Dict]) -> str:
+	def format_articles_to_string(self, articles: List[Article]) -> str:
 		"""
-		Takes a list of article dicts and returns a formatted string.
+		Takes a list of articles and returns a formatted string.
 
 		Args:
-			articles (list): List of article dictionaries
+			articles (list): List of articles
 
 		Returns:
 			str: Formatted string combining the articles
 		"""
-		result = []
+		buf = io.StringIO()
 		for article in articles:
-			title = article.get("title", "No Title")
-			timestamp = article.get("timestamp", "No Timestamp")
-			content = article.get("content", "No Content")
+			buf.write(f"📰 {article.title}\n🕒 {article.timestamp}\n\n")
+			buf.write(article.content)
+			buf.write("\n")
+			buf.write(_SEP)
+			buf.write("\n\n")
 
-			# Skip articles with no content
-			if not content or not isinstance(content, str) or content.strip() == "":
-				continue
+		return buf.getvalue().rstrip()
 
-			formatted = f"📰 {title}\n🕒 {timestamp}\n\n{content.strip()}\n{'-' * 80}"
-			result.append(formatted)
+	def group_articles(self, articles: List[Article], max_tokens: int = _MAX_PROMPT_TOKENS) -> List[List[Article]]:
+		"""
+		Split articles into consecutive groups that each fit a single Gemini prompt.
 
-		return "\n\n".join(result)
+		Args:
+			articles (list): List of articles
+			max_tokens (int): Approximate token budget per group
 
-	def create_morning_report(self, recent_articles_text: str) -> str:
+		Returns:
+			list: Groups of articles; a single group when everything fits in one prompt
 		"""
-		Generate a comprehensive premarket report using AI.
+		groups = []
+		current = []
+		current_tokens = 0
+
+		for article in articles:
+			tokens = len(article.content) // 4
+			if current and current_tokens + tokens > max_tokens:
+				groups.append(current)
+				current = []
+				current_tokens = 0
+			current.append(article)
+			current_tokens += tokens
+
+		if current:
+			groups.append(current)
+		return groups
+
+	async def _summarize_group(self, articles_text: str) -> str:
+		"""
+		Condense one group of articles into notes for the final report.
 
 		Args:
-			recent_articles_text (str): Formatted string of recent articles
+			articles_text (str): Formatted string of the group's articles
 
 		Returns:
-			str: Generated premarket report
+			str: Condensed notes for the group
+		"""
+		parts = []
+		async for chunk in await self.gemini_client.aio.models.generate_content_stream(
+			model=_GEMINI_MODEL,
+			contents=_SUMMARY_PROMPT_TEMPLATE.format(input=articles_text)
+		):
+			if chunk.text:
+				parts.append(chunk.text)
+		return "".join(parts).strip()
+
+	def summarize_article_groups(self, groups: List[List[Article]]) -> List[str]:
+		"""
+		Summarize article groups concurrently with the async Gemini client.
+
+		Args:
+			groups (list): Groups of articles from `group_articles`
+
+		Returns:
+			list: One set of condensed notes per group, in the same order
 		"""
-		prompt = f"""
-			You are a financial analyst generating a comprehensive Premarket Report for equity traders in India.
+		async def run():
+			return await asyncio.gather(*[
+				self._summarize_group(self.format_articles_to_string(group)) for group in groups
+			])
 
-			Based on the following raw market news and updates, write a concise, actionable, and well-structured report suitable to be read by traders before the Indian stock market opens.
+		return self._loop.run_until_complete(run())
 
-			The report should include:
-			- 🔔 A crisp summary of global cues (GIFT Nifty, US markets, crude, gold, dollar index, bond yields, Asian markets)
-			- 📊 Domestic market setup: Nifty/Sensex close, support/resistance levels, VIX, FII/DII flows, PCR
-			- 🔍 Stocks in Focus with reason (news impact, earnings, regulatory update, deals, etc.)
-			- 💹 Top Trading Ideas (stock, CMP, buy/sell, target, SL)
-			- 📢 Corporate actions or events (dividends, bonus, board meetings, SME listings)
-			- 🧾 Bulk/Block deals or fund flow highlights
-			- ⚠️ Risks to watch (macro, geopolitical, etc.)
-			- ✅ A strategy summary to guide the trading day
+	def create_morning_report(self, recent_articles_text: str) -> str:
+		"""
+		Generate a comprehensive premarket report using AI.
 
-			Remove any fluff before the first emoji section like 🔔 or 📊.
-			Format the output using emojis and headers to make it engaging and scannable. Keep the tone clear, professional, and trader-friendly.
+		Args:
+			recent_articles_text (str): Formatted string of recent articles
 
-			Here is the raw input: {recent_articles_text} """
+		Returns:
+			str: Generated premarket report
+		"""
+		prompt = _PROMPT_TEMPLATE.format(input=recent_articles_text)
 
 		# try:
 		print('==================> ', recent_articles_text[:500])
-		response = self.gemini_client.models.generate_content(
-			model="gemini-2.5-flash",
+		# Stream the response so the transfer overlaps with generation
+		parts = []
+		for chunk in self.gemini_client.models.generate_content_stream(
+			model=_GEMINI_MODEL,
 			contents=prompt
-		)
-		text = response.text.strip()
+		):
+			if chunk.text:
+				parts.append(chunk.text)
+		text = "".join(parts).strip()
 		# Strip invalid characters like *** at the beginning
 		text = re.sub(r'^[\*\-#>]+', '', text).strip()
 		print("===========================> ", text)
@@ -331,13 +823,53 @@ class PremarketReportGenerator:
 
 		# Send the email via Gmail SMTP
 		try:
-			with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-				server.login(from_email, app_password)
-				server.send_message(msg)
+			self._get_smtp(from_email, app_password).send_message(msg)
 			print("✅ Email sent successfully.")
 		except Exception as e:
 			raise RuntimeError(f"Failed to send email: {e}")
 
+	def _get_smtp(self, from_email: str, app_password: str) -> smtplib.SMTP_SSL:
+		"""
+		Return a logged-in Gmail SMTP connection, reusing the previous one while it is healthy.
+
+		Args:
+			from_email (str): Sender email address
+			app_password (str): Gmail app password
+
+		Returns:
+			smtplib.SMTP_SSL: Authenticated SMTP connection
+		"""
+		if self._smtp is not None:
+			try:
+				if self._smtp.noop()[0] == 250:
+					return self._smtp
+			except (smtplib.SMTPException, OSError):
+				pass
+			# Stale connection, drop it and reconnect below
+			self.close_smtp()
+
+		# Only cache the connection once it is authenticated
+		server = smtplib.SMTP_SSL("smtp.gmail.com", 465)
+		try:
+			server.login(from_email, app_password)
+		except Exception:
+			server.close()
+			raise
+		self._smtp = server
+		return self._smtp
+
+	def close_smtp(self) -> None:
+		"""
+		Close the cached SMTP connection, if any.
+		"""
+		if self._smtp is None:
+			return
+		try:
+			self._smtp.quit()
+		except (smtplib.SMTPException, OSError):
+			self._smtp.close()
+		self._smtp = None
+
 	def generate_and_send_report(self, pages: int = 10, hours: int = 24, 
 							   subject: str = "📈 Daily Premarket Report",
 							   to_email: Optional[str] = None) -> str:
@@ -354,8 +886,14 @@ class PremarketReportGenerator:
 			str: The generated report text
 		"""
 		print("🔍 Fetching news links...")
-		links = self.get_news_links(pages)
-		print(f"📄 Found {len(links)} article links")
+		listings = self.get_news_listings(pages)
+		print(f"📄 Found {len(listings)} article links")
+
+		# Skip downloading articles the listing already shows as too old; links
+		# without a listing timestamp are checked after scraping instead
+		cutoff = datetime.now() - timedelta(hours=hours)
+		links = [url for url, listed_at in listings if listed_at is None or listed_at >= cutoff]
+		print(f"⏰ Kept {len(links)} links listed in the last {hours} hours")
 
 		print("📰 Scraping articles...")
 		articles = self.scrape_articles_multithreaded(links)
@@ -370,13 +908,22 @@ class PremarketReportGenerator:
 			return ""
 
 		print("📝 Formatting articles...")
-		articles_text = self.format_articles_to_string(recent_articles)
+		groups = self.group_articles(recent_articles)
+		if len(groups) > 1:
+			# Too much text for one prompt: summarize groups in parallel, then merge below
+			print(f"🧩 Summarizing {len(groups)} article groups in parallel...")
+			articles_text = "\n\n".join(self.summarize_article_groups(groups))
+		else:
+			articles_text = self.format_articles_to_string(recent_articles)
 
 		print("🤖 Generating AI report...")
 		report = self.create_morning_report(articles_text)
 
 		print("📧 Sending email report...")
-		self.send_email_report(report, subject, to_email)
+		try:
+			self.send_email_report(report, subject, to_email)
+		finally:
+			self.close_smtp()
 
 		return report
 
@@ -397,21 +944,20 @@ def main():
 		raise ValueError("GEMINI_API_KEY environment variable is required")
 
 	# Initialize the generator
-	generator = PremarketReportGenerator(
+	with PremarketReportGenerator(
 		gemini_api_key=GEMINI_API_KEY,
 		email_config=EMAIL_CONFIG
-	)
-
-	# Generate and send the report
-	try:
-		report = generator.generate_and_send_report(
-			pages=10,
-			hours=24,
-			subject="📈 Daily Premarket Report"
-		)
-		print("🎉 Report generated and sent successfully!")
-	except Exception as e:
-		print(f"❌ Error: {e}")
+	) as generator:
+		# Generate and send the report
+		try:
+			report = generator.generate_and_send_report(
+				pages=10,
+				hours=24,
+				subject="📈 Daily Premarket Report"
+			)
+			print("🎉 Report generated and sent successfully!")
+		except Exception as e:
+			print(f"❌ Error: {e}")
 
 
 if __name__ == "__main__":